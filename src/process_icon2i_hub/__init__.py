@@ -1,10 +1,28 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from .icon_2i import _ICON2IRetriever, _ICON2IIngestor
+import importlib
 import importlib.util
+
+# DOC: Lazy re-exports (PEP 562) — the xarray/pygrib/boto3 stack loads on first use of a symbol,
+# not at package import, so CLI startup and --help stay fast
+_LAZY_EXPORTS = {
+    '_ICON2IRetriever': '.icon_2i',
+    '_ICON2IIngestor': '.icon_2i',
+    'run_icon2i_ingestor': '.main',
+    'run_icon2i_retriever': '.main',
+    'parse_event': '.utils.strings',
+}
 if importlib.util.find_spec('pygeoapi') is not None:
-    from .icon_2i import ICON2IRetrieverProcessor, ICON2IIngestorProcessor
+    _LAZY_EXPORTS.update({
+        'ICON2IRetrieverProcessor': '.icon_2i',
+        'ICON2IIngestorProcessor': '.icon_2i',
+    })
 
-from .main import run_icon2i_ingestor, run_icon2i_retriever
-from .utils.strings import parse_event
\ No newline at end of file
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
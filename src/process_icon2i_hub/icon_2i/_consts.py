@@ -1,5 +1,8 @@
+import os
+
 import numpy as np
 import xarray as xr
+import zarr
 
 _DATASET_NAME = 'ICON_2I_SURFACE_PRESSURE_LEVELS'
 
@@ -7,6 +10,23 @@ _BASE_URL = 'https://meteohub.agenziaitaliameteo.it/api'
 _AVALIABLE_DATA_URL = f'{_BASE_URL}/datasets/{_DATASET_NAME}/opendata'
 _RETRIEVE_DATA_URL = lambda data_filename: f'{_BASE_URL}/opendata/{data_filename}'
 
+# DOC: Format of the cached per-variable daily files. 'zarr' stores each date as a zipped Zarr
+# store (consolidated metadata → one small read to open, chunk-level lazy reads), 'nc' keeps the
+# compressed netCDF files. One object per variable/date either way, so the bucket layout is unchanged.
+_CACHE_FORMAT = os.environ.get('ICON2I_CACHE_FORMAT', 'nc')
+_CACHE_FORMAT_EXTS = {'nc': 'nc', 'zarr': 'zarr.zip'}
+
+def _DATE_DATASET_FILENAME(variable, date):
+    return f'{_DATASET_NAME}__{variable}__{date}.{_CACHE_FORMAT_EXTS[_CACHE_FORMAT]}'
+
+def _open_date_dataset(filepath):
+    """
+    Open a cached per-variable daily file regardless of the cache format it was written with.
+    """
+    if filepath.endswith('.zarr.zip'):
+        return xr.open_zarr(zarr.storage.ZipStore(filepath, mode='r'), consolidated=True)
+    return xr.open_dataset(filepath)
+
 
 class _VARIABLES:
     """
@@ -23,46 +43,83 @@ class _VARIABLES:
     TOTAL_PRECIPITATION = 'Total Precipitation'
 
 
-_VARIABLES_LIST = [attr for attr in dir(_VARIABLES) if not attr.startswith('_')]
+# DOC: Precomputed literals — no dir() reflection or dict rebuild at import time
+_VARIABLES_LIST = [
+    'TEMPERATURE',
+    'DEWPOINT_TEMPERATURE',
+    'U_WIND_COMPONENT',
+    'V_WIND_COMPONENT',
+    'TOTAL_CLOUD_COVER',
+    'TEMPERATURE_G',
+    'SNOW_DEPTH_WATER_EQUIVALENT',
+    'PRESSURE_REDUCED_TO_MSL',
+    'TOTAL_PRECIPITATION',
+]
 
-_VARIABLE_CODE = lambda variable: variable.replace(' ', '_').lower()
-_VARIABLES_DICT =  { _VARIABLE_CODE(variable): _VARIABLES.__dict__[variable] for variable in _VARIABLES_LIST }
+def _VARIABLE_CODE(variable):
+    return variable.replace(' ', '_').lower()
+
+_VARIABLES_DICT = {
+    'temperature': _VARIABLES.TEMPERATURE,
+    'dewpoint_temperature': _VARIABLES.DEWPOINT_TEMPERATURE,
+    'u_wind_component': _VARIABLES.U_WIND_COMPONENT,
+    'v_wind_component': _VARIABLES.V_WIND_COMPONENT,
+    'total_cloud_cover': _VARIABLES.TOTAL_CLOUD_COVER,
+    'temperature_g': _VARIABLES.TEMPERATURE_G,
+    'snow_depth_water_equivalent': _VARIABLES.SNOW_DEPTH_WATER_EQUIVALENT,
+    'pressure_reduced_to_msl': _VARIABLES.PRESSURE_REDUCED_TO_MSL,
+    'total_precipitation': _VARIABLES.TOTAL_PRECIPITATION,
+}
+
+_VARIABLES_CODES = (
+    'temperature',
+    'dewpoint_temperature',
+    'u_wind_component',
+    'v_wind_component',
+    'total_cloud_cover',
+    'temperature_g',
+    'snow_depth_water_equivalent',
+    'pressure_reduced_to_msl',
+    'total_precipitation',
+)
+
+def _decumulate(data_cube):
+    """
+    Turn a cumulative data cube into per-step increments, in place (single pass, no reallocation).
+    """
+    np.subtract(data_cube[1:], data_cube[:-1], out=data_cube[1:])
+    return data_cube
 
 _DATA_CUBE_PROCESSING = {
-    _VARIABLE_CODE("TOTAL_PRECIPITATION"): lambda data_cube: np.concatenate(([data_cube[0]], np.diff(data_cube, axis=0)), axis=0)
+    'total_precipitation': _decumulate
 }
 
 class _DERIVED_VARIABLES:
     """
     Class to hold some variables that can be computed from _VARIABLES
     """
-    WIND_SPEED = list(map(_VARIABLE_CODE, ["U_WIND_COMPONENT", "V_WIND_COMPONENT"]))
-    WIND_DIRECTION = list(map(_VARIABLE_CODE, ["U_WIND_COMPONENT", "V_WIND_COMPONENT"]))
+    WIND_SPEED = ['u_wind_component', 'v_wind_component']
+    WIND_DIRECTION = ['u_wind_component', 'v_wind_component']
 
-_DERIVED_VARIABLES_LIST = [attr for attr in dir(_DERIVED_VARIABLES) if not attr.startswith('_')]
-_DERIVED_VARIABLES_DICT =  { _VARIABLE_CODE(variable): _DERIVED_VARIABLES.__dict__[variable] for variable in _DERIVED_VARIABLES_LIST }
+_DERIVED_VARIABLES_LIST = ['WIND_SPEED', 'WIND_DIRECTION']
 
-def compute_wind_speed(wind_u, wind_v):
-    ds_wu = xr.open_dataset(wind_u)
-    ds_wv = xr.open_dataset(wind_v)
-    ds_wind_speed = xr.Dataset(
-        data_vars=dict(
-            wind_speed = (["time", "lat", "lon"], np.sqrt(ds_wu.u_wind_component.data**2 + ds_wv.v_wind_component.data**2))
-        ),
-        coords = dict(
-            time = ds_wu.time,
-            lat = ds_wu.lat,
-            lon = ds_wu.lon,
-        )
-    )
-    return ds_wind_speed
+_DERIVED_VARIABLES_DICT = {
+    'wind_speed': _DERIVED_VARIABLES.WIND_SPEED,
+    'wind_direction': _DERIVED_VARIABLES.WIND_DIRECTION,
+}
 
-def compute_wind_direction(wind_u, wind_v):
-    ds_wu = xr.open_dataset(wind_u)
-    ds_wv = xr.open_dataset(wind_v)
-    ds_wind_direction = xr.Dataset(
+def compute_wind(wind_u, wind_v):
+    """
+    Compute both wind speed and direction from the u/v component files in a single open.
+    """
+    ds_wu = _open_date_dataset(wind_u)
+    ds_wv = _open_date_dataset(wind_v)
+    u = ds_wu.u_wind_component.data
+    v = ds_wv.v_wind_component.data
+    ds_wind = xr.Dataset(
         data_vars=dict(
-            wind_direction = (["time", "lat", "lon"], np.arctan2(ds_wv.v_wind_component.data, ds_wu.u_wind_component.data) * (180 / np.pi))
+            wind_speed = (["time", "lat", "lon"], np.hypot(u, v)),
+            wind_direction = (["time", "lat", "lon"], np.degrees(np.arctan2(v, u)))
         ),
         coords = dict(
             time = ds_wu.time,
@@ -70,11 +127,21 @@ def compute_wind_direction(wind_u, wind_v):
             lon = ds_wu.lon,
         )
     )
-    return ds_wind_direction
+    return ds_wind
 
-#ds['wind_direction'] = np.arctan2(ds.wind_v, ds.wind_u) * (180 / np.pi)
+def compute_wind_speed(wind_u, wind_v):
+    return compute_wind(wind_u, wind_v)[['wind_speed']]
+
+def compute_wind_direction(wind_u, wind_v):
+    return compute_wind(wind_u, wind_v)[['wind_direction']]
 
 _DERIVED_VARIABLES_COMPUTE = {
-    _VARIABLE_CODE("WIND_SPEED"): compute_wind_speed,
-    _VARIABLE_CODE("WIND_DIRECTION"): compute_wind_direction,
+    'wind_speed': compute_wind_speed,
+    'wind_direction': compute_wind_direction,
+}
+
+# DOC: Derived variables that share source files and one intermediate compute — the ingestor calls
+# the shared function once per date and slices one variable out per save, so nothing outlives the run
+_DERIVED_VARIABLES_SHARED_COMPUTE = {
+    ('u_wind_component', 'v_wind_component'): compute_wind,
 }
\ No newline at end of file
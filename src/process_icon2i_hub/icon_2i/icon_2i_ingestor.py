@@ -1,15 +1,22 @@
 import os
 import json
+import time
 import uuid
+import shutil
+import zipfile
 import traceback
 import datetime
 import urllib3
 import requests
+from requests.adapters import HTTPAdapter
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 import numpy as np
 import pandas as pd
 import pygrib
 import xarray as xr
+import dask.array as dask_array
 
 from . import _consts
 from ..cli.module_log import Logger
@@ -20,6 +27,21 @@ from ..utils.status_exception import StatusException
 urllib3.disable_warnings()
 
 
+_HTTP_SESSION = None
+
+def _http_session():
+    """
+    Lazily build the shared keep-alive HTTP session.
+    Kept at module level (not on the instance) so the ingestor stays picklable for worker processes.
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
 class _ICON2IIngestor():
     """
     Class to retrieve data from ARPAV Precipitation sensors.
@@ -32,10 +54,14 @@ class _ICON2IIngestor():
     _tmp_data_folder = os.path.join(os.getcwd(), name)
 
     def __init__(self):
-        
+
         if not os.path.exists(self._tmp_data_folder):
             os.makedirs(self._tmp_data_folder)
 
+        # DOC: Short-TTL cache of the avaliable-data listing (hit several times per run)
+        self._avaliable_data_cache = None
+        self._avaliable_data_cache_ts = 0.0
+
 
     def _set_tmp_data_folder(self, tmp_data_folder):
         """
@@ -47,25 +73,33 @@ class _ICON2IIngestor():
         Logger.debug(f'Set temporary data folder to: {self._tmp_data_folder}')
         
 
+    _avaliable_data_cache_ttl = 60   # seconds
+
     def get_avaliable_forecast_runs(self):
-        
+
         def parse_avaliable_data(avaliable_data_response):
             avaliable_data = pd.DataFrame(avaliable_data_response.json())
-            avaliable_data['forecast_run'] = avaliable_data.apply(lambda row: datetime.datetime.fromisoformat(f'{row.date}T{row.run}'), axis=1)
+            avaliable_data['forecast_run'] = pd.to_datetime(avaliable_data['date'].astype(str) + 'T' + avaliable_data['run'].astype(str))
             return avaliable_data
 
-        avaliable_data_response = requests.get(_consts._AVALIABLE_DATA_URL)
+        # DOC: validation, filename lookup and download all ask for this listing → avoid re-fetching within the same run
+        if self._avaliable_data_cache is not None and time.time() - self._avaliable_data_cache_ts < self._avaliable_data_cache_ttl:
+            return self._avaliable_data_cache
+
+        avaliable_data_response = _http_session().get(_consts._AVALIABLE_DATA_URL)
         if avaliable_data_response.status_code == 200:
             avaliable_data = parse_avaliable_data(avaliable_data_response)
+            self._avaliable_data_cache = avaliable_data
+            self._avaliable_data_cache_ts = time.time()
         else:
             print('Error while requesting avaliable data endpoint')
 
         return avaliable_data
-    
-    
+
+
     def ping_avaliable_runs(self, forecast_datetime_runs):
         avaliable_data = self.get_avaliable_forecast_runs()
-        avaliable_runs = avaliable_data.forecast_run.tolist()
+        avaliable_runs = set(avaliable_data.forecast_run)
         return all(fdr in avaliable_runs for fdr in forecast_datetime_runs)
     
 
@@ -143,52 +177,89 @@ class _ICON2IIngestor():
 
     def download_icon2I_data(self, forecast_datetime_runs):
         request_file_names = self.get_icon2I_data_filenames(forecast_datetime_runs)
-        icon2I_file_paths = []
-        for rf in request_file_names:
-            response = requests.get(_consts._RETRIEVE_DATA_URL(rf), stream=True)
-            if response.status_code == 200:
-                rf_filename = os.path.join(self._tmp_data_folder, rf)
-                with open(rf_filename, "wb") as grib_file:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        grib_file.write(chunk)
-                icon2I_file_paths.append(rf_filename)
-            else:
-                print(f'Request error {response.status_code} with file "{rf}"')
+        if len(request_file_names) == 0:
+            return []
+
+        def fetch_file(rf):
+            with _http_session().get(_consts._RETRIEVE_DATA_URL(rf), stream=True) as response:
+                if response.status_code == 200:
+                    rf_filename = os.path.join(self._tmp_data_folder, rf)
+                    # DOC: decode any gzip transfer-encoding transparently while copying in C
+                    response.raw.decode_content = True
+                    with open(rf_filename, "wb") as grib_file:
+                        shutil.copyfileobj(response.raw, grib_file, length=1<<20)
+                    return rf_filename
+                else:
+                    print(f'Request error {response.status_code} with file "{rf}"')
+                    return None
+
+        # DOC: Downloads are network-bound → fetch them in parallel (order preserved by executor.map)
+        with ThreadPoolExecutor(max_workers=min(8, len(request_file_names))) as executor:
+            icon2I_file_paths = [fp for fp in executor.map(fetch_file, request_file_names) if fp is not None]
         return icon2I_file_paths
 
 
     def icon_2I_time_concat(self, grib_dss, variable):
         varaible_name = _consts._VARIABLES_DICT[variable]
 
+        # DOC: Select messages per file and order files by first valid date → the concatenated
+        # time axis comes out already monotonic and no global sort is needed afterwards
+        gmsgs = [grib_ds.select(name=varaible_name) for grib_ds in grib_dss]
+        gmsgs.sort(key=lambda msgs: msgs[0].validDate)
+
         dss = []
-        for ids, grib_ds in enumerate(grib_dss):
-            
-            # DOC: se ci sono altri dataset sucessivi prendo solo prime 12 h altrimenti tutto il forecast disponibile 72h (12 files)
-            gmsg = [msg for msg in list(grib_ds) if msg.name==varaible_name][: 12 if ids < len(grib_dss)-1 else 72]
+        for ids, gmsg in enumerate(gmsgs):
 
-            grib_data = []
+            # DOC: se ci sono altri dataset sucessivi prendo solo prime 12 h altrimenti tutto il forecast disponibile 72h (12 files)
+            gmsg = gmsg[: 12 if ids < len(gmsgs)-1 else 72]
 
             ts = gmsg[0].validDate
-            lat_range = gmsg[0].data()[1][:,0]
-            lon_range = gmsg[0].data()[2][0,:]
+            lats, lons = gmsg[0].latlons()
+            lat_range = lats[:,0]
+            lon_range = lons[0,:]
             times_range = []
 
+            # DOC: Decode each message straight into a preallocated float32 buffer → no per-message intermediate arrays
+            np_dataset = np.empty((len(gmsg), lat_range.size, lon_range.size), dtype=np.float32)
             for i,msg in enumerate(gmsg):
-                if msg.name == varaible_name:
-                    
-                    # !!!: This was tested only with Total Precipitation messages
-                    values, lats, lons = msg.data()
-                    times_range.append(ts + datetime.timedelta(hours=i))
-
-                    data = np.stack([np.where(d.data==9999.0, np.nan, d.data) for d in values])
-                    grib_data.append(data)
 
-            # DOC: Stack data and apply data-cube processing if defined for the variable
-            np_dataset = np.stack(grib_data)
+                # !!!: This was tested only with Total Precipitation messages
+                times_range.append(ts + datetime.timedelta(hours=i))
+
+                values = msg.values
+                if np.ma.isMaskedArray(values):
+                    # DOC: pygrib already masked the missing values → a single C-level fill, no sentinel compare
+                    np.copyto(np_dataset[i], np.ma.filled(values, np.nan), casting='unsafe')
+                else:
+                    np.copyto(np_dataset[i], values, casting='unsafe')
+                    mask = np.equal(np_dataset[i], 9999.0)
+                    np_dataset[i][mask] = np.nan
+
+            # DOC: Grids come pre-sorted from the GRIB template; when lat/lon are descending a
+            # reversed-stride view is enough to make them ascending (no copy, no argsort)
+            if lat_range[0] > lat_range[-1]:
+                lat_range = lat_range[::-1]
+                np_dataset = np_dataset[:, ::-1, :]
+            if lon_range[0] > lon_range[-1]:
+                lon_range = lon_range[::-1]
+                np_dataset = np_dataset[:, :, ::-1]
+
+            # DOC: Round+cast the coords here in one pass → no assign_coords/reindex needed after concat
+            lat_range = lat_range.astype(np.float32)
+            np.round(lat_range, 6, out=lat_range)
+            lon_range = lon_range.astype(np.float32)
+            np.round(lon_range, 6, out=lon_range)
+
+            # DOC: Apply data-cube processing if defined for the variable
             np_dataset = _consts._DATA_CUBE_PROCESSING.get(_consts._VARIABLE_CODE(variable), lambda x: x)(np_dataset)
+
+            # DOC: Clip negatives in place (NaNs pass through) — one pass, no boolean cube
+            np.maximum(np_dataset, 0, out=np_dataset)
+
+            # DOC: Wrap as a chunked dask array → concat stays lazy and to_netcdf streams chunk by chunk
             ds = xr.Dataset(
                 {
-                    variable: (["time", "lat", "lon"], np_dataset.astype(np.float32))
+                    variable: (["time", "lat", "lon"], dask_array.from_array(np_dataset, chunks=(12, -1, -1)))
                 },
                 coords={
                     "time": times_range,
@@ -198,44 +269,97 @@ class _ICON2IIngestor():
             )
             dss.append(ds)
 
-        ds = xr.concat(dss, dim='time')
-        ds = ds.assign_coords(
-            lat=np.round(ds.lat.values, 6).astype(np.float32),
-            lon=np.round(ds.lon.values, 6).astype(np.float32),
-        )
-        ds = ds.sortby(['time', 'lat', 'lon'])
-        ds[variable] = xr.where(ds[variable] < 0, 0, ds[variable])
+            # DOC: Messages for this file are fully decoded → drop them so the GRIB buffers can be freed
+            gmsgs[ids] = None
+
+        # DOC: Spatial coords are identical across files and time is pre-sorted → skip alignment and the global sort
+        ds = xr.concat(dss, dim='time', coords='minimal', compat='override', join='override')
         return ds
 
     def save_date_datasets(self, date_datasets, variable, out_dir, bucket_destination):
         """
         Save the date datasets to the specified output directory and upload to S3 if bucket_destination is provided.
+        Uploads run on a background thread pool so each one overlaps the next dataset's netCDF write.
         """
         date_dataset_refs = []
-        for dt, ds in date_datasets:
-            fn = f'{_consts._DATASET_NAME}__{variable}__{dt}.nc'
-            fp = os.path.join(out_dir, fn)
-            ds.to_netcdf(fp)
-            date_dataset_ref = dict(
-                variable = variable,
-                date = dt,
-                ref = dict( filepath=fp )
-            )
-            if bucket_destination:
-                uri = os.path.join(bucket_destination, fn)
-                module_s3.s3_upload(fp, uri, remove_src=False)
-                date_dataset_ref['ref']['uri'] = uri
-            date_dataset_refs.append(date_dataset_ref)
+        upload_futures = []
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for dt, ds in date_datasets:
+                fn = _consts._DATE_DATASET_FILENAME(variable, dt)
+                fp = os.path.join(out_dir, fn)
+                if _consts._CACHE_FORMAT == 'zarr':
+                    # DOC: Write a consolidated Zarr store chunked for sub-day reads, then zip it so the
+                    # cache stays one object per variable/date (a ZipStore cannot be written in place)
+                    store_dir = fp[:-len('.zip')]
+                    ds.chunk({'time': 24, 'lat': min(256, ds.sizes['lat']), 'lon': min(256, ds.sizes['lon'])}).to_zarr(store_dir, mode='w', consolidated=True)
+                    with zipfile.ZipFile(fp, 'w', compression=zipfile.ZIP_STORED) as zip_file:
+                        for store_root, _, store_files in os.walk(store_dir):
+                            for store_file in store_files:
+                                store_filepath = os.path.join(store_root, store_file)
+                                zip_file.write(store_filepath, os.path.relpath(store_filepath, store_dir))
+                    shutil.rmtree(store_dir)
+                else:
+                    # DOC: Compressed per-timestep-chunked writes → roughly halves file size and upload bytes
+                    encoding = {
+                        variable: {
+                            'zlib': True,
+                            'complevel': 1,
+                            'shuffle': True,
+                            'chunksizes': (1, ds.sizes['lat'], ds.sizes['lon']),
+                            'dtype': 'float32',
+                            '_FillValue': np.float32(np.nan),
+                        }
+                    }
+                    ds.to_netcdf(fp, engine='h5netcdf', encoding=encoding)
+                date_dataset_ref = dict(
+                    variable = variable,
+                    date = dt,
+                    ref = dict( filepath=fp )
+                )
+                if bucket_destination:
+                    uri = os.path.join(bucket_destination, fn)
+                    upload_futures.append(executor.submit(module_s3.s3_upload, fp, uri, remove_src=False))
+                    date_dataset_ref['ref']['uri'] = uri
+                date_dataset_refs.append(date_dataset_ref)
+
+            # DOC: Wait for all uploads before handing out the refs
+            for upload_future in upload_futures:
+                upload_future.result()
         return date_dataset_refs
 
 
+    def _process_variable(self, var, icon2I_file_paths, out_dir, bucket_destination):
+        """
+        Extract a single variable from the downloaded GRIB files and save its per-date datasets.
+        Opens its own GRIB indexes so it can run inside a worker process (pygrib handles are not fork-safe).
+        """
+        # DOC: A name-keyed index makes the per-variable message lookup a C-level query instead of a full scan
+        gribs = [pygrib.index(gf, 'name') for gf in icon2I_file_paths]
+        try:
+            # DOC: Concatenate the gribs into a single xarray dataset
+            timeserie_dataset = self.icon_2I_time_concat(gribs, var)
+        finally:
+            # DOC: Everything is decoded at this point → release the GRIB indexes before the save/upload phase
+            for grib_ds in gribs:
+                grib_ds.close()
+
+        # DOC: Split the dataset into individual date datasets
+        date_datasets = self.get_single_date_dataset(timeserie_dataset)
+
+        # DOC: Save the date datasets to the output directory and upload to S3 if specified
+        return self.save_date_datasets(date_datasets, var, out_dir, bucket_destination)
+
+
     def get_single_date_dataset(self, dataset):
-        dates = sorted(list(set(dataset.time.dt.date.values)))
-        date_datasets = []
-        for date in dates:
-            subset = dataset.sel(time=dataset.time.dt.date == date)
-            date_datasets.append((date, subset))
-        
+        # DOC: Floor the time axis to days once, then slice each date via precomputed integer indexes
+        # (np.unique returns the dates already sorted)
+        dates_arr = dataset.time.dt.floor('D').values
+        uniq_dates, inverse = np.unique(dates_arr, return_inverse=True)
+        date_datasets = [
+            (pd.Timestamp(uniq_dates[i]).date(), dataset.isel(time=np.flatnonzero(inverse == i)))
+            for i in range(len(uniq_dates))
+        ]
+
         # DOC: Discard datasets with only 12 values that refers to date before current date
         date_datasets = [(dt,ds) for dt,ds in date_datasets if not (dt < datetime.datetime.today().date() and len(ds.time) == 12)]
         return date_datasets
@@ -276,36 +400,44 @@ class _ICON2IIngestor():
             # DOC: Get the available forecast runs
             icon2I_file_paths = self.download_icon2I_data(forecast_run)
 
-            # DOC: Extract each variable from the gribs
+            # DOC: Extract each variable from the gribs — variables are independent, so dispatch one
+            # worker process per variable and let decode/compute/upload overlap across cores.
+            # Skip the pool entirely for an empty variable list (max_workers must be > 0)
             variables_date_datasets_refs = []
-            for var in variable:
-                # DOC: Open gribs
-                gribs = [pygrib.open(gf) for gf in icon2I_file_paths]
-
-                # DOC: Concatenate the gribs into a single xarray dataset
-                timeserie_dataset = self.icon_2I_time_concat(gribs, var)
-
-                # DOC: Split the dataset into individual date datasets
-                date_datasets = self.get_single_date_dataset(timeserie_dataset)
-
-                # DOC: Save the date datasets to the output directory and upload to S3 if specified
-                variable_date_datasets_refs = self.save_date_datasets(date_datasets, var, out_dir, bucket_destination)
-
-                # DOC: Collect all variables+date datasets references
-                variables_date_datasets_refs.extend(variable_date_datasets_refs)
-
-            # DOC: Compute each derived variable 
+            if len(variable) > 0:
+                with ProcessPoolExecutor(max_workers=min(len(variable), os.cpu_count())) as executor:
+                    for variable_date_datasets_refs in executor.map(
+                        self._process_variable,
+                        variable,
+                        repeat(icon2I_file_paths),
+                        repeat(out_dir),
+                        repeat(bucket_destination)
+                    ):
+                        # DOC: Collect all variables+date datasets references
+                        variables_date_datasets_refs.extend(variable_date_datasets_refs)
+
+            # DOC: Compute each derived variable — dates outer, so derived variables sharing one
+            # intermediate (wind u/v → speed + direction) compute it once per date and slice a
+            # variable out per save; the intermediate is dropped with the loop iteration instead of
+            # whole Datasets being memoized for the life of the process
             derived_variables_date_datasets_refs = []
-            df_vars = pd.DataFrame(variables_date_datasets_refs).groupby(by='date')
-            for dvar in derived_variable:
-                derived_date_datasets = []
-                og_vars = _consts._DERIVED_VARIABLES_DICT[dvar]
-                for dt,df_var in df_vars:
-                    df_var.set_index('variable', inplace=True)
+            df_vars = pd.DataFrame(variables_date_datasets_refs, columns=['variable', 'date', 'ref']).groupby(by='date')
+            derived_date_datasets = {dvar: [] for dvar in derived_variable}
+            for dt,df_var in df_vars:
+                df_var.set_index('variable', inplace=True)
+                shared_datasets = {}
+                for dvar in derived_variable:
+                    og_vars = tuple(_consts._DERIVED_VARIABLES_DICT[dvar])
                     og_dss = [df_var.loc[ogv].ref['filepath'] for ogv in og_vars]
-                    dds = _consts._DERIVED_VARIABLES_COMPUTE[dvar](*og_dss)
-                    derived_date_datasets.append((dt, dds))
-                derived_variable_date_datasets_refs = self.save_date_datasets(derived_date_datasets, dvar, out_dir, bucket_destination)
+                    if og_vars in _consts._DERIVED_VARIABLES_SHARED_COMPUTE:
+                        if og_vars not in shared_datasets:
+                            shared_datasets[og_vars] = _consts._DERIVED_VARIABLES_SHARED_COMPUTE[og_vars](*og_dss)
+                        dds = shared_datasets[og_vars][[dvar]]
+                    else:
+                        dds = _consts._DERIVED_VARIABLES_COMPUTE[dvar](*og_dss)
+                    derived_date_datasets[dvar].append((dt, dds))
+            for dvar in derived_variable:
+                derived_variable_date_datasets_refs = self.save_date_datasets(derived_date_datasets[dvar], dvar, out_dir, bucket_destination)
                 derived_variables_date_datasets_refs.extend(derived_variable_date_datasets_refs)
 
             # DOC: Prepare the output
@@ -1,15 +1,20 @@
 import os
 import json
+import time
 import uuid
+import hashlib
 import datetime
 import urllib3
 import requests
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
+import pydantic
 import pygrib
 import xarray as xr
-import gdal2numpy as g2n
+from osgeo import gdal, osr
 
 from . import _consts
 from .icon_2i_ingestor import _ICON2IIngestor
@@ -21,16 +26,167 @@ from ..utils.status_exception import StatusException
 urllib3.disable_warnings()
 
 
+# DOC: ICON-2I uses a single fixed grid → round the coords once per grid hash and reuse them across per-date datasets
+_GEO_COORD_CACHE = {}
+
+def _rounded_geo_coords(dataset):
+    lat = dataset.lat.values
+    lon = dataset.lon.values
+    key = hashlib.md5(lat.tobytes() + lon.tobytes()).hexdigest()
+    if key not in _GEO_COORD_CACHE:
+        lat = np.round(lat, 6)
+        lon = np.round(lon, 6)
+        geo_sorted = bool(np.all(np.diff(lat) > 0) and np.all(np.diff(lon) > 0))
+        _GEO_COORD_CACHE[key] = (lat, lon, geo_sorted)
+    return _GEO_COORD_CACHE[key]
+
+
+# DOC: Nodata fill of the raster bands — jitted with numba when available (parallel LLVM loop over
+# all cores, in place), else the single-threaded numpy path. cache=True keeps the compiled artifact
+# on disk so only the first call ever pays the compile time.
+if importlib.util.find_spec('numba') is not None:
+    import numba
+
+    @numba.njit(cache=True, parallel=True)
+    def _fill_nodata(band_data, nodata):
+        for i in numba.prange(band_data.shape[0]):
+            for j in range(band_data.shape[1]):
+                if np.isnan(band_data[i, j]):
+                    band_data[i, j] = nodata
+        return band_data
+else:
+    def _fill_nodata(band_data, nodata):
+        # DOC: NaN-only on purpose — np.nan_to_num would also rewrite ±inf, diverging from the
+        # numba kernel above
+        band_data[np.isnan(band_data)] = nodata
+        return band_data
+
+
+# DOC: Overlapping requests re-probe the same keys within seconds — memoize positive HeadObject
+# results for a short TTL. Only hits are cached (cached objects are not deleted within the TTL),
+# so a freshly ingested dataset becomes visible immediately.
+_S3_HEAD_CACHE = {}
+_S3_HEAD_CACHE_TTL = 60
+
+def _s3_key_exists(uri):
+    now = time.time()
+    cached_ts = _S3_HEAD_CACHE.get(uri)
+    if cached_ts is not None and now - cached_ts < _S3_HEAD_CACHE_TTL:
+        return True
+    if module_s3.s3_head(uri) is not None:
+        if len(_S3_HEAD_CACHE) > 1024:
+            # DOC: pop() tolerates another thread pruning the same expired key concurrently
+            for key, key_ts in list(_S3_HEAD_CACHE.items()):
+                if now - key_ts >= _S3_HEAD_CACHE_TTL:
+                    _S3_HEAD_CACHE.pop(key, None)
+        _S3_HEAD_CACHE[uri] = now
+        return True
+    return False
+
+
+class _RetrieveParams(pydantic.BaseModel):
+    """
+    Validated retriever arguments — the type checks run in pydantic-core's compiled
+    validators, the model validator keeps the original normalization rules.
+    """
+
+    variable: str | list[str] | None = None
+    lat_range: list[float] | None = None
+    long_range: list[float] | None = None
+    time_range: str | datetime.datetime | list[str | datetime.datetime] | None = None
+    out_format: str | None = None
+    bucket_source: str | None = None
+    bucket_destination: str | None = None
+    out: str | None = None
+
+    derived_variable: list[str] = []
+    time_start: datetime.datetime | None = None
+    time_end: datetime.datetime | None = None
+
+    @pydantic.model_validator(mode='after')
+    def _normalize(self):
+        if self.variable is None:
+            self.variable = list(_consts._VARIABLES_DICT.keys())
+            Logger.debug(f'No variable specified, collect all variables: {self.variable}')
+        if isinstance(self.variable, str):
+            self.variable = [self.variable]
+        if not all(v in _consts._VARIABLES_DICT or v in _consts._DERIVED_VARIABLES_DICT for v in self.variable):
+            raise ValueError(f'Invalid variable "{self.variable}". Must be one of {_consts._VARIABLES_DICT.keys()}')
+        self.derived_variable = list(set([dv for dv in self.variable if dv in _consts._DERIVED_VARIABLES_DICT]))
+        self.variable = list(set([v for v in self.variable if v not in self.derived_variable] + [v for dv in self.derived_variable for v in _consts._DERIVED_VARIABLES_DICT[dv]]))
+
+        for range_name, range_value, range_min, range_max in (('lat_range', self.lat_range, -90, 90), ('long_range', self.long_range, -180, 180)):
+            if range_value is not None:
+                if len(range_value) != 2:
+                    raise ValueError(f'{range_name} must be a list of 2 elements')
+                if range_value[0] < range_min or range_value[0] > range_max or range_value[1] < range_min or range_value[1] > range_max:
+                    raise ValueError(f'{range_name} elements must be in the range [{range_min}, {range_max}]')
+                if range_value[0] > range_value[1]:
+                    raise ValueError(f'{range_name}[0] must be less than {range_name}[1]')
+
+        time_start = self.time_range[0] if isinstance(self.time_range, list) else self.time_range
+        time_end = self.time_range[1] if isinstance(self.time_range, list) else None
+        if time_start is None:
+            raise ValueError('Cannot process without a time valued')
+        if isinstance(time_start, str):
+            try:
+                time_start = datetime.datetime.fromisoformat(time_start)
+            except ValueError:
+                raise ValueError('time_start must be a valid datetime iso-format string')
+        if time_end is not None:
+            if isinstance(time_end, str):
+                try:
+                    time_end = datetime.datetime.fromisoformat(time_end)
+                except ValueError:
+                    raise ValueError('time_end must be a valid datetime iso-format string')
+            if time_start > time_end:
+                raise ValueError('time_start must be less than time_end')
+
+        self.time_start = time_start.replace(minute=(time_start.minute // 5) * 5, second=0, microsecond=0)
+        self.time_end = time_end.replace(minute=(time_end.minute // 5) * 5, second=0, microsecond=0) if time_end is not None else self.time_start + datetime.timedelta(hours=1)
+        if self.time_end < (datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(hours=48)).replace(tzinfo=None):
+            raise ValueError('Time range must be within the last 48 hours')
+
+        if self.out_format is None:
+            self.out_format = 'tif'
+        if self.out_format not in ['tif']:
+            raise ValueError('out_format must be one of ["tif"]')
+
+        if self.bucket_destination is not None and not self.bucket_destination.startswith('s3://'):
+            raise ValueError('bucket_destination must start with "s3://"')
+        if self.bucket_source is not None:
+            if not self.bucket_source.startswith('s3://'):
+                raise ValueError('bucket_source must start with "s3://"')
+        else:
+            self.bucket_source = self.bucket_destination
+
+        if self.out is not None:
+            if not self.out.endswith('.tif'):
+                raise ValueError('out must end with ".tif"')
+            dirname, _ = os.path.split(self.out)
+            if dirname != '' and not os.path.exists(dirname):
+                os.makedirs(dirname)
+
+        return self
+
+
 class _ICON2IRetriever():
 
     name = f'{_consts._DATASET_NAME}__Retriever'
-    
+
     _tmp_data_folder = os.path.join(os.getcwd(), name)
 
+    # DOC: Downloaded source files live outside _tmp_data_folder so the per-request cleanup does not
+    # wipe them — overlapping/repeat requests reuse the cached copies instead of re-downloading
+    _download_cache_folder = os.path.join(os.getcwd(), f'{name}__DownloadCache')
+    _download_cache_max_bytes = 10 * 1024 ** 3
+
     def __init__(self):
-        
+
         if not os.path.exists(self._tmp_data_folder):
             os.makedirs(self._tmp_data_folder)
+        if not os.path.exists(self._download_cache_folder):
+            os.makedirs(self._download_cache_folder, exist_ok=True)
 
     def _set_tmp_data_folder(self, tmp_data_folder):
         """
@@ -49,203 +205,222 @@ class _ICON2IRetriever():
 
         print(f"Validating arguments: {kwargs}")
 
-        variable = kwargs.get('variable', None)
-        lat_range = kwargs.get('lat_range', None)
-        long_range = kwargs.get('long_range', None)
-        time_range = kwargs.get('time_range', None)
-        time_start = time_range[0] if type(time_range) in [list, tuple] else time_range
-        time_end = time_range[1] if type(time_range) in [list, tuple] else None
-        out_format = kwargs.get('out_format', None)
-        bucket_source = kwargs.get('bucket_source', None)
-        bucket_destination = kwargs.get('bucket_destination', None)
-        out = kwargs.get('out', None)
-
-        if variable is None:
-            variable = list(_consts._VARIABLES_DICT.keys())
-            Logger.debug(f'No variable specified, collect all variables: {variable}')
-        if not isinstance(variable, (str, list)):
-            raise StatusException(StatusException.INVALID, 'variable must be a string or a list of strings')
-        if isinstance(variable, str):
-            variable = [variable]
-        if not all(isinstance(v, str) for v in variable):
-            raise StatusException(StatusException.INVALID, 'All variables must be strings')
-        if not all(v in _consts._VARIABLES_DICT or v in _consts._DERIVED_VARIABLES_DICT for v in variable):
-            raise StatusException(StatusException.INVALID, f'Invalid variable "{variable}". Must be one of {_consts._VARIABLES_DICT.keys()}')
-        derived_variable = list(set([dv for dv in variable if dv in _consts._DERIVED_VARIABLES_DICT]))
-        variable = list(set([v for v in variable if v not in derived_variable] + [v for dv in derived_variable for v in _consts._DERIVED_VARIABLES_DICT[dv]]))
-        
-        if lat_range is not None:
-            if type(lat_range) is not list or len(lat_range) != 2:
-                raise StatusException(StatusException.INVALID, 'lat_range must be a list of 2 elements')
-            if type(lat_range[0]) not in [int, float] or type(lat_range[1]) not in [int, float]:
-                raise StatusException(StatusException.INVALID, 'lat_range elements must be float')
-            if lat_range[0] < -90 or lat_range[0] > 90 or lat_range[1] < -90 or lat_range[1] > 90:
-                raise StatusException(StatusException.INVALID, 'lat_range elements must be in the range [-90, 90]')
-            if lat_range[0] > lat_range[1]:
-                raise StatusException(StatusException.INVALID, 'lat_range[0] must be less than lat_range[1]')
-        
-        if long_range is not None:
-            if type(long_range) is not list or len(long_range) != 2:
-                raise StatusException(StatusException.INVALID, 'long_range must be a list of 2 elements')
-            if type(long_range[0]) not in [int, float] or type(long_range[1]) not in [int, float]:
-                raise StatusException(StatusException.INVALID, 'long_range elements must be float')
-            if long_range[0] < -180 or long_range[0] > 180 or long_range[1] < -180 or long_range[1] > 180:
-                raise StatusException(StatusException.INVALID, 'long_range elements must be in the range [-180, 180]')
-            if long_range[0] > long_range[1]:
-                raise StatusException(StatusException.INVALID, 'long_range[0] must be less than long_range[1]')
-        
-        if time_start is None:
-            raise StatusException(StatusException.INVALID, 'Cannot process without a time valued')
-        if type(time_start) is not str:
-            raise StatusException(StatusException.INVALID, 'time_start must be a string')
-        if type(time_start) is str:
-            try:
-                time_start = datetime.datetime.fromisoformat(time_start)
-            except ValueError:
-                raise StatusException(StatusException.INVALID, 'time_start must be a valid datetime iso-format string')
-        
-        if time_end is not None:
-            if type(time_end) is not str:
-                raise StatusException(StatusException.INVALID, 'time_end must be a string')
-            if type(time_end) is str:
-                try:
-                    time_end = datetime.datetime.fromisoformat(time_end)
-                except ValueError:
-                    raise StatusException(StatusException.INVALID, 'time_end must be a valid datetime iso-format string')
-            if time_start > time_end:
-                raise StatusException(StatusException.INVALID, 'time_start must be less than time_end')
-            
-        time_start = time_start.replace(minute=(time_start.minute // 5) * 5, second=0, microsecond=0)
-        time_end = time_end.replace(minute=(time_end.minute // 5) * 5, second=0, microsecond=0) if time_end is not None else time_start + datetime.timedelta(hours=1)
-        if time_end < (datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(hours=48)).replace(tzinfo=None):
-            raise StatusException(StatusException.INVALID, 'Time range must be within the last 48 hours')
-
-        if out_format is not None:  
-            if type(out_format) is not str:
-                raise StatusException(StatusException.INVALID, 'out_format must be a string or null')
-            if out_format not in ['tif']:
-                raise StatusException(StatusException.INVALID, 'out_format must be one of ["tif"]')
-        else:
-            out_format = 'tif'
-        
-        if bucket_destination is not None:
-            if type(bucket_destination) is not str:
-                raise StatusException(StatusException.INVALID, 'bucket_destination must be a string')
-            if not bucket_destination.startswith('s3://'):
-                raise StatusException(StatusException.INVALID, 'bucket_destination must start with "s3://"')
-            
-        if bucket_source is not None:
-            if type(bucket_source) is not str:
-                raise StatusException(StatusException.INVALID, 'bucket_source must be a string')
-            if not bucket_source.startswith('s3://'):
-                raise StatusException(StatusException.INVALID, 'bucket_source must start with "s3://"')
-        else:
-            bucket_source = bucket_destination
-            
-        if out is not None:
-            if type(out) is not str:
-                raise StatusException(StatusException.INVALID, 'out must be a string')
-            if not out.endswith('.tif'):
-                raise StatusException(StatusException.INVALID, 'out must end with ".tif"')
-            dirname, _ = os.path.split(out)
-            if dirname != '' and not os.path.exists(dirname):
-                os.makedirs(dirname)
+        try:
+            params = _RetrieveParams(
+                variable = kwargs.get('variable', None),
+                lat_range = kwargs.get('lat_range', None),
+                long_range = kwargs.get('long_range', None),
+                time_range = kwargs.get('time_range', None),
+                out_format = kwargs.get('out_format', None),
+                bucket_source = kwargs.get('bucket_source', None),
+                bucket_destination = kwargs.get('bucket_destination', None),
+                out = kwargs.get('out', None),
+            )
+        except pydantic.ValidationError as err:
+            raise StatusException(StatusException.INVALID, '; '.join(f'{".".join(map(str, e["loc"]))}: {e["msg"]}' if e['loc'] else e['msg'].removeprefix('Value error, ') for e in err.errors()))
 
         return {
-            'variable': variable + derived_variable,
-            'lat_range': lat_range,
-            'long_range': long_range,
-            'time_start': time_start,
-            'time_end': time_end,
-            'out_format': out_format,
-            'bucket_source': bucket_source,
-            'bucket_destination': bucket_destination,
-            'out': out
+            'variable': params.variable + params.derived_variable,
+            'lat_range': params.lat_range,
+            'long_range': params.long_range,
+            'time_start': params.time_start,
+            'time_end': params.time_end,
+            'out_format': params.out_format,
+            'bucket_source': params.bucket_source,
+            'bucket_destination': params.bucket_destination,
+            'out': params.out
         }
     
 
-    def retrieve_icon2I_data(self, variable, lat_range, lon_range, time_start, time_end, bucket_source):
+    def _download_cache_lookup(self, uri):
+        """
+        Return (cached filepath or None, head metadata) for an S3 object — the cached copy is valid
+        when it still matches the remote ContentLength and ETag kept in a JSON sidecar.
+        """
+        local_file = os.path.join(self._download_cache_folder, os.path.basename(uri))
+        meta_file = f'{local_file}.meta'
+        head = module_s3.s3_head(uri)
+        if head is not None and os.path.isfile(local_file) and os.path.isfile(meta_file):
+            try:
+                with open(meta_file) as mf:
+                    meta = json.load(mf)
+            except (OSError, json.JSONDecodeError):
+                meta = None
+            if meta is not None and meta.get('ETag') == head.get('ETag') and meta.get('ContentLength') == head.get('ContentLength') and os.path.getsize(local_file) == head.get('ContentLength'):
+                Logger.debug(f'Download cache hit: {uri}')
+                # DOC: Refresh the mtime so eviction stays oldest-first by last use
+                os.utime(local_file)
+                return local_file, head
+        return None, head
+
+    def _write_download_meta(self, local_file, head):
+        """
+        Persist the remote ContentLength/ETag sidecar a cache lookup validates against.
+        """
+        if head is not None:
+            with open(f'{local_file}.meta', 'w') as mf:
+                json.dump({'ETag': head.get('ETag'), 'ContentLength': head.get('ContentLength')}, mf)
+
+    def _evict_download_cache(self):
+        """
+        Keep the persistent download cache below its size budget by evicting the least recently used files.
+        """
+        with os.scandir(self._download_cache_folder) as entries:
+            cached_files = [
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in entries
+                if entry.is_file(follow_symlinks=False) and not entry.name.endswith('.meta')
+            ]
+        total_size = sum(file_size for _, file_size, _ in cached_files)
+        for _, file_size, file_path in sorted(cached_files):
+            if total_size <= self._download_cache_max_bytes:
+                break
+            try:
+                os.remove(file_path)
+                if os.path.isfile(f'{file_path}.meta'):
+                    os.remove(f'{file_path}.meta')
+            except OSError:
+                continue
+            total_size -= file_size
+
+
+    def dataset_query(self, dataset, lat_range, lon_range, time_range):
+        """
+        Filter a dataset by latitude, longitude, and time range.
+        """
+        # DOC: .sel returns lazy views — no defensive copy needed
+        query_dataset = dataset
+        if isinstance(lat_range, list) and len(lat_range) == 2:
+            query_dataset = query_dataset.sel(lat=slice(lat_range[0], lat_range[1]))
+        elif isinstance(lat_range, (float, int)):
+            query_dataset = query_dataset.sel(lat=lat_range, method="nearest")
+
+        if isinstance(lon_range, list) and len(lon_range) == 2:
+            query_dataset = query_dataset.sel(lon=slice(lon_range[0], lon_range[1]))
+        elif isinstance(lon_range, (float, int)):
+            query_dataset = query_dataset.sel(lon=lon_range, method="nearest")
+
+        if isinstance(time_range, list) and len(time_range) == 2:
+            query_dataset = query_dataset.sel(time=slice(time_range[0], time_range[1]))
+        elif isinstance(time_range, str) or isinstance(time_range, datetime.datetime):
+            query_dataset = query_dataset.sel(time=time_range, method="nearest")
+
+        return query_dataset
+
+
+    def retrieve_icon2I_data(self, variable, lat_range, lon_range, time_start, time_end, bucket_source, cache_geo_coords=True):
 
         # DOC: Check if the dataset is available in the source bucket
         def check_date_dataset_avaliability(variable, requested_dates, bucket_source):
-            requested_source_uris = [f'{bucket_source}/{_consts._DATASET_NAME}__{variable}__{d}.nc' for d in requested_dates]
-            bucket_source_filekeys = module_s3.s3_list(bucket_source, filename_prefix=f'{_consts._DATASET_NAME}__{variable}__')
-            bucket_source_uris = [f'{bucket_source}/{filesystem.justfname(f)}' for f in bucket_source_filekeys]
-            avaliable_uris = [ru for ru in requested_source_uris if ru in bucket_source_uris]
-            if len(avaliable_uris) != len(requested_dates):
+            requested_source_uris = [f'{bucket_source}/{_consts._DATE_DATASET_FILENAME(variable, d)}' for d in requested_dates]
+            # DOC: Probe each requested key with head_object in parallel — a bucket-wide listing
+            # grows with bucket size, while N head probes stay O(requested dates)
+            with ThreadPoolExecutor(max_workers=min(16, len(requested_source_uris))) as executor:
+                present = list(executor.map(_s3_key_exists, requested_source_uris))
+            if not all(present):
                 return None
-            return avaliable_uris
+            return requested_source_uris
         
 
-        requested_dates = pd.date_range(time_start, time_end, freq='1d').to_series().apply(lambda d: d.date()).to_list()
-        
-        variable_datasets = dict()
-        for var in variable:
-           
-            data_source_uris = check_date_dataset_avaliability(var, requested_dates, bucket_source) if bucket_source is not None else None
-
-            # DOC: If the dataset is not available in the source bucket, run the ingestor to retrieve it
-            # DOC: It is convenient to ingest all the requested variables due to high probability that if one is missing then also the others are missing .. so let's do it once
-            if data_source_uris is None:
-                icon2i_ingestor = _ICON2IIngestor()
-                icon2i_ingestor_out = icon2i_ingestor.run(
-                    variable = variable,
-                    forecast_run = list(map(lambda d: d.isoformat(), requested_dates)),
-                    out_dir = self._tmp_data_folder,
-                    bucket_destination = bucket_source
-                )
-                if icon2i_ingestor_out.get('status', 'ERROR') != 'OK':
-                    raise StatusException(StatusException.ERROR, f'Error during ICON2I ingestor run: {icon2i_ingestor_out["message"]}')    
-                data_source_uris = [cdi['ref'] for cdi in icon2i_ingestor_out['collected_data_info'] if cdi['variable'] == var]
-
-            # DOC: Now we have the data source URIs, we can retrieve the data
-            retrived_files = []
-            for dsu in data_source_uris:
-                if dsu.startswith('s3://'):
-                    rf = os.path.join(self._tmp_data_folder, os.path.basename(dsu))
-                    module_s3.s3_download(dsu, rf)
-                    retrived_files.append(rf)
-                else:
-                    retrived_files.append(dsu)
-                
-            datasets = [xr.open_dataset(rf) for rf in retrived_files]
-            dataset = xr.concat(datasets, dim='time')
-            dataset = dataset.assign_coords(
-                lat=np.round(dataset.lat.values, 6),
-                lon=np.round(dataset.lon.values, 6),
+        # DOC: DatetimeIndex.date converts in one C-level pass — no Series or per-element lambda
+        requested_dates = pd.date_range(time_start.date(), time_end.date(), freq='D').date.tolist()
+
+        # DOC: Probe availability for every variable up front so the ingestor fallback runs at most once
+        variable_source_uris = {
+            var: check_date_dataset_avaliability(var, requested_dates, bucket_source) if bucket_source is not None else None
+            for var in variable
+        }
+
+        # DOC: If some dataset is not available in the source bucket, run the ingestor to retrieve it
+        # DOC: It is convenient to ingest all the requested variables due to high probability that if one is missing then also the others are missing .. so let's do it once
+        if any(uris is None for uris in variable_source_uris.values()):
+            icon2i_ingestor = _ICON2IIngestor()
+            icon2i_ingestor_out = icon2i_ingestor.run(
+                variable = variable,
+                forecast_run = list(map(lambda d: d.isoformat(), requested_dates)),
+                out_dir = self._tmp_data_folder,
+                bucket_destination = bucket_source
             )
-            dataset = dataset.sortby(['time', 'lat', 'lon'])
-
-            # DOC: Filter the dataset by latitude, longitude, and time range
-            def dataset_query(dataset, lat_range, lon_range, time_range):
-                query_dataset = dataset.copy()
-                if isinstance(lat_range, list) and len(lat_range) == 2:
-                    query_dataset = query_dataset.sel(lat=slice(lat_range[0], lat_range[1]))
-                elif isinstance(lat_range, (float, int)):
-                    query_dataset = query_dataset.sel(lat=lat_range, method="nearest")
-
-                if isinstance(lon_range, list) and len(lon_range) == 2:
-                    query_dataset = query_dataset.sel(lon=slice(lon_range[0], lon_range[1]))
-                elif isinstance(lon_range, (float, int)):
-                    query_dataset = query_dataset.sel(lon=lon_range, method="nearest")
-
-                if isinstance(time_range, list) and len(time_range) == 2:
-                    query_dataset = query_dataset.sel(time=slice(time_range[0], time_range[1]))
-                elif isinstance(time_range, str) or isinstance(time_range, datetime.datetime):
-                    query_dataset = query_dataset.sel(time=time_range, method="nearest")
-
-                return query_dataset
-            dataset = dataset_query(dataset, lat_range, lon_range, [time_start, time_end])       
-            
-            variable_datasets[var] = dataset
+            if icon2i_ingestor_out.get('status', 'ERROR') != 'OK':
+                raise StatusException(StatusException.ERROR, f'Error during ICON2I ingestor run: {icon2i_ingestor_out["message"]}')
+            for var, uris in variable_source_uris.items():
+                if uris is None:
+                    variable_source_uris[var] = [cdi['ref'] for cdi in icon2i_ingestor_out['collected_data_info'] if cdi['variable'] == var]
+
+        def retrieve_variable(var):
+            data_source_uris = variable_source_uris[var]
+
+            # DOC: Now we have the data source URIs, we can retrieve the data — probe the persistent
+            # cache for every object in parallel, then fetch the misses in one latency-hiding batch
+            s3_uris = [dsu for dsu in data_source_uris if dsu.startswith('s3://')]
+            local_map = {}
+            if len(s3_uris) > 0:
+                with ThreadPoolExecutor(max_workers=min(16, len(s3_uris))) as executor:
+                    cache_lookups = dict(zip(s3_uris, executor.map(self._download_cache_lookup, s3_uris)))
+                local_map = {uri: local_file for uri, (local_file, _) in cache_lookups.items() if local_file is not None}
+                missing_uris = [uri for uri in s3_uris if uri not in local_map]
+                if len(missing_uris) > 0:
+                    download_pairs = [(uri, os.path.join(self._download_cache_folder, os.path.basename(uri))) for uri in missing_uris]
+                    module_s3.s3_download_many(download_pairs)
+                    for uri, local_file in download_pairs:
+                        self._write_download_meta(local_file, cache_lookups[uri][1])
+                        local_map[uri] = local_file
+                    self._evict_download_cache()
+            retrived_files = [local_map.get(dsu, dsu) for dsu in data_source_uris]
+                
+            # DOC: Lazy parallel open of all per-date files — per-file metadata reads fan out on dask
+            # workers and data stays chunked/on-demand instead of being loaded per file and re-copied by concat
+            # DOC: Clip to the requested bounding box as each file is opened, so every file contributes
+            # only its AOI slab instead of the full ICON-2I grid being concatenated and sliced afterwards
+            if _consts._CACHE_FORMAT == 'zarr':
+                # DOC: Each zipped store opens with a single consolidated-metadata read; data reads stay chunk-level and lazy
+                dataset = xr.concat(
+                    [self.dataset_query(_consts._open_date_dataset(rf), lat_range, lon_range, None) for rf in retrived_files],
+                    dim='time', coords='minimal', compat='override', join='override',
+                )
+            else:
+                dataset = xr.open_mfdataset(
+                    retrived_files,
+                    engine='h5netcdf',
+                    combine='nested',
+                    concat_dim='time',
+                    parallel=True,
+                    chunks={'time': 24},
+                    # DOC: Chunks are read once into the concat cube — skip xarray's per-variable read cache
+                    cache=False,
+                    preprocess=lambda ds: self.dataset_query(ds, lat_range, lon_range, None),
+                )
+            if cache_geo_coords:
+                lat, lon, geo_sorted = _rounded_geo_coords(dataset)
+            else:
+                lat = np.round(dataset.lat.values, 6)
+                lon = np.round(dataset.lon.values, 6)
+                geo_sorted = False
+            dataset = dataset.assign_coords(lat=lat, lon=lon)
+            # DOC: sortby triggers a global argsort and materializes the cube — sort only the axes that are actually out of order
+            if not dataset.indexes['time'].is_monotonic_increasing:
+                dataset = dataset.sortby('time')
+            if not geo_sorted:
+                for geo_coord in ('lat', 'lon'):
+                    if not dataset.indexes[geo_coord].is_monotonic_increasing:
+                        dataset = dataset.sortby(geo_coord)
+
+            # DOC: Spatial clipping already happened per file — only the time range is left to filter
+            dataset = self.dataset_query(dataset, None, None, [time_start, time_end])
+
+            return var, dataset
+
+        # DOC: Per-variable retrieval is S3/disk-bound → run the requested variables concurrently
+        # (clamped to 1 worker so an empty variable list does not break the pool)
+        with ThreadPoolExecutor(max_workers=max(1, len(variable))) as executor:
+            variable_datasets = dict(executor.map(retrieve_variable, variable))
 
-            # return dataset
-        
         return variable_datasets
     
 
     def create_timestamp_raster(self, variable, dataset, out):
-        timestamps = [datetime.datetime.fromisoformat(str(ts).replace('.000000000','')).isoformat(timespec='seconds') for ts in dataset.time.values]
+        # DOC: One vectorized strftime pass instead of str()/fromisoformat round-trips per timestep
+        timestamps = dataset.time.dt.strftime('%Y-%m-%dT%H:%M:%S').values.tolist()
         
         if out is None:
             multiband_raster_filename = f'{_consts._DATASET_NAME}/{variable}/{_consts._DATASET_NAME}__{variable}__{timestamps[0]}.tif'
@@ -253,30 +428,65 @@ class _ICON2IRetriever():
         else:
             multiband_raster_filepath = out
         
-        xmin, xmax = dataset.lon.min().item(), dataset.lon.max().item()
-        ymin, ymax = dataset.lat.min().item(), dataset.lat.max().item()
-        nx, ny = dataset.dims['lon'], dataset.dims['lat']
-        pixel_size_x = (xmax - xmin) / nx
-        pixel_size_y = (ymax - ymin) / ny
-
-        data = dataset.sortby('lat', ascending=False)[variable].values
-        geotransform = (xmin, pixel_size_x, 0, ymax, 0, -pixel_size_y)
+        # DOC: Coords are monotonic — read the extent/step straight off the arrays instead of running
+        # four reductions, and use the coord spacing (N-1 intervals) so the pixel size is not off by one.
+        # Coords are cell centers, so the transform origin shifts out by half a pixel.
+        lon = dataset.lon.values
+        lat = dataset.lat.values
+
+        # DOC: A range narrower than the grid spacing clips to a single row/column — there is no
+        # coord spacing left to derive the pixel size from, so reject it with a clear message
+        if len(lon) < 2 or len(lat) < 2:
+            raise StatusException(StatusException.INVALID, f'The requested lat/long range selects only {len(lat)} lat x {len(lon)} lon grid points; the range must be wider than the grid spacing')
+
+        xmin, ymax = lon[0], lat[-1]
+        pixel_size_x = (lon[-1] - lon[0]) / (len(lon) - 1)
+        pixel_size_y = (lat[-1] - lat[0]) / (len(lat) - 1)
+
+        geotransform = (xmin - pixel_size_x / 2, pixel_size_x, 0, ymax + abs(pixel_size_y) / 2, 0, -abs(pixel_size_y))
         projection = dataset.attrs.get('crs', 'EPSG:4326')
-        
-        g2n.Numpy2GTiffMultiBanda(
-            data,
-            geotransform,
-            projection,
+
+        dirname, _ = os.path.split(multiband_raster_filepath)
+        if dirname != '' and not os.path.exists(dirname):
+            os.makedirs(dirname, exist_ok=True)
+
+        # DOC: Flip lat with a negative-stride view — lat is monotonic by construction, so no argsort is needed —
+        # and stream the raster band-by-band: each band materializes only its own H×W float32 slab from the
+        # dask graph instead of the whole T×H×W cube being loaded up front
+        data_array = dataset[variable].isel(lat=slice(None, None, -1))
+
+        srs = osr.SpatialReference()
+        srs.SetFromUserInput(projection)
+        # DOC: Suffix the temp file with the variable — a shared `out` path must not collide on the
+        # intermediate GTiff when several variables are rendered
+        tmp_raster_filepath = f'{multiband_raster_filepath}.{variable}.tmp.tif'
+        raster_ds = gdal.GetDriverByName('GTiff').Create(
+            tmp_raster_filepath,
+            len(lon), len(lat), len(timestamps),
+            gdal.GDT_Float32,
+            options=['COMPRESS=DEFLATE', 'TILED=YES', 'NUM_THREADS=ALL_CPUS', 'BIGTIFF=IF_SAFER'],
+        )
+        raster_ds.SetGeoTransform(geotransform)
+        raster_ds.SetProjection(srs.ExportToWkt())
+        for band_index, timestamp in enumerate(timestamps):
+            band_data = _fill_nodata(np.ascontiguousarray(data_array.isel(time=band_index).values.astype('float32', copy=False)), np.float32(-9999.0))
+            band = raster_ds.GetRasterBand(band_index + 1)
+            band.WriteArray(band_data)
+            band.SetNoDataValue(-9999.0)
+            band.SetDescription(timestamp)
+        raster_ds.FlushCache()
+        raster_ds = None
+
+        # DOC: Final COG pass with the floating-point predictor — float32 weather fields compress
+        # 2-3× better than plain DEFLATE, shrinking the file and every upload/download of it
+        gdal.Translate(
             multiband_raster_filepath,
-            format="COG",
-            save_nodata_as=-9999.0,
-            metadata={
-                'band_names': timestamps,
-                'type': '', # product.measure_type,  # !!!: To be defined
-                'unit': '' # product.measure_unit   # !!!: To be defined
-            }
+            tmp_raster_filepath,
+            format='COG',
+            creationOptions=['COMPRESS=DEFLATE', 'PREDICTOR=3', 'NUM_THREADS=ALL_CPUS', 'BIGTIFF=IF_SAFER'],
         )
-    
+        os.remove(tmp_raster_filepath)
+
         return multiband_raster_filepath
 
     
@@ -336,20 +546,20 @@ class _ICON2IRetriever():
                 lon_range=long_range,
                 time_start=time_start,
                 time_end=time_end,
-                bucket_source=bucket_source
+                bucket_source=bucket_source,
+                cache_geo_coords=kwargs.get('cache_geo_coords', True)
             )
 
             # DOC: Retrieve the data and create timestamp rasters for each variable
-            variables_timestamp_rasters_refs = dict()
-            for var, dataset in variable_datasets.items():
-                
+            def create_and_store_raster(var_dataset):
+                var, dataset = var_dataset
+
                 # DOC: Create timestamp raster
                 timestamp_raster = self.create_timestamp_raster(
                     variable = var,
                     dataset = dataset,
                     out = out
                 )
-                variables_timestamp_rasters_refs[var] = timestamp_raster
 
                 # DOC: If out is provided, store the data in the specified location
                 if bucket_destination is not None:
@@ -358,7 +568,18 @@ class _ICON2IRetriever():
                     if not upload_status:
                         raise StatusException(StatusException.ERROR, f"Failed to upload data to bucket {bucket_destination}")
                     Logger.debug(f"Data stored in bucket: {bucket_uri}")
-                    variables_timestamp_rasters_refs[var] = bucket_uri
+                    return var, bucket_uri
+
+                return var, timestamp_raster
+
+            # DOC: Raster writes and uploads are independent per variable → fan them out on threads.
+            # With an explicit `out` every variable writes the same file, so that case stays
+            # sequential: deterministic last-writer-wins in insertion order instead of a race on `out`
+            if out is not None:
+                variables_timestamp_rasters_refs = dict(map(create_and_store_raster, variable_datasets.items()))
+            else:
+                with ThreadPoolExecutor(max_workers=max(1, len(variable_datasets))) as executor:
+                    variables_timestamp_rasters_refs = dict(executor.map(create_and_store_raster, variable_datasets.items()))
 
 
             # DOC: Prepare outputs
@@ -374,7 +595,7 @@ class _ICON2IRetriever():
                     ]
                 }
             else:
-                outputs = timestamp_raster
+                outputs = list(variables_timestamp_rasters_refs.values())[-1]
             
             return outputs
 
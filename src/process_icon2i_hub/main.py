@@ -23,66 +23,61 @@
 # Created:     18/03/2021
 # -----------------------------------------------------------------------------
 import click
-import pprint
-import traceback
-import json
+import logging
+import functools
+import threading
 
 from .cli.module_log import Logger
 from .utils.status_exception import StatusException
 from .utils.module_prologo import prologo, epilogo
 
-from .icon_2i import _ICON2IIngestor, _ICON2IRetriever
+# DOC: _ICON2IIngestor / _ICON2IRetriever are imported inside the run_* functions — pulling the
+# xarray/pygrib/boto3 stack at module import would make every CLI invocation (even --help) pay for it
 
 
 # REGION: [ ICON2I INGESTOR ] ========================================================================================
 
-class _ARG_NAMES_ICON2I_INGESTOR():
-    VARIABLE = {
-        'aliases': ['--variable', '--var'],
-        'help': "Variable to retrieve, either 'precipitation' or 'water_level'.",
-        'default': None,
-        'example': '--variable precipitation',
-    }
-    FORECAST_RUN = {
-        'aliases': ['--forecast_run', '--fr'],
-        'help': "Forecast run to retrieve, either 'latest' or a specific date in ISO 8601 format.",
-        'default': None,
-        'example': '--forecast_run 2025-07-23T00:00:00',
-    }
-    OUT_DIR = {
-        'aliases': ['--out_dir', '--output_dir', '--od'],
-        'help': "Output directory for the retrieved data. If not provided, the output will be returned as a dictionary.",
-        'default': None,
-        'example': '--out_dir /path/to/output',
-    }
-    BUCKET_DESTINATION = {
-        'aliases': ['--bucket_destination', '--bucket', '--s3'],
-        'help': "Destination bucket for the output data.",
-        'default': None,
-        'example': '--bucket_destination s3://my-bucket/path/to/prefix',
-    }
+def _ingestor_run_in_process(variable, forecast_run, out_dir, bucket_destination):
+    """
+    Worker-process entry point for the ingestor — must be a module-level function to be picklable.
+    """
+    from .icon_2i import _ICON2IIngestor
+    return _ICON2IIngestor().run(
+        variable=variable,
+        forecast_run=forecast_run,
+        out_dir=out_dir,
+        bucket_destination=bucket_destination,
+    )
+
+
+# DOC: Option tables as flat module constants — aliases expand straight into the decorators,
+# no class/dict indirection at import time
+_INGESTOR_VARIABLE_OPT = ('--variable', '--var')
+_INGESTOR_VARIABLE_HELP = "Variable to retrieve, either 'precipitation' or 'water_level'."
+_INGESTOR_FORECAST_RUN_OPT = ('--forecast_run', '--fr')
+_INGESTOR_FORECAST_RUN_HELP = "Forecast run to retrieve, either 'latest' or a specific date in ISO 8601 format."
+_INGESTOR_OUT_DIR_OPT = ('--out_dir', '--output_dir', '--od')
+_INGESTOR_OUT_DIR_HELP = "Output directory for the retrieved data. If not provided, the output will be returned as a dictionary."
+_INGESTOR_BUCKET_DESTINATION_OPT = ('--bucket_destination', '--bucket', '--s3')
+_INGESTOR_BUCKET_DESTINATION_HELP = "Destination bucket for the output data."
 
 @click.command()
 @click.option(
-    *_ARG_NAMES_ICON2I_INGESTOR.VARIABLE['aliases'],
+    *_INGESTOR_VARIABLE_OPT,
     type=click.Choice(['total_precipitation'], case_sensitive=True),
-    default=_ARG_NAMES_ICON2I_INGESTOR.VARIABLE['default'],
-    help=_ARG_NAMES_ICON2I_INGESTOR.VARIABLE['help'],
+    default=None, help=_INGESTOR_VARIABLE_HELP,
 )
 @click.option(
-    *_ARG_NAMES_ICON2I_INGESTOR.FORECAST_RUN['aliases'],
-    type=str, default=_ARG_NAMES_ICON2I_INGESTOR.FORECAST_RUN['default'],
-    help=_ARG_NAMES_ICON2I_INGESTOR.FORECAST_RUN['help'],
+    *_INGESTOR_FORECAST_RUN_OPT,
+    type=str, default=None, help=_INGESTOR_FORECAST_RUN_HELP,
 )
 @click.option(
-    *_ARG_NAMES_ICON2I_INGESTOR.OUT_DIR['aliases'],
-    type=str, default=_ARG_NAMES_ICON2I_INGESTOR.OUT_DIR['default'],
-    help=_ARG_NAMES_ICON2I_INGESTOR.OUT_DIR['help'],
+    *_INGESTOR_OUT_DIR_OPT,
+    type=str, default=None, help=_INGESTOR_OUT_DIR_HELP,
 )
 @click.option(
-    *_ARG_NAMES_ICON2I_INGESTOR.BUCKET_DESTINATION['aliases'],
-    type=str, default=_ARG_NAMES_ICON2I_INGESTOR.BUCKET_DESTINATION['default'],
-    help=_ARG_NAMES_ICON2I_INGESTOR.BUCKET_DESTINATION['help'],
+    *_INGESTOR_BUCKET_DESTINATION_OPT,
+    type=str, default=None, help=_INGESTOR_BUCKET_DESTINATION_HELP,
 )
 # -----------------------------------------------------------------------------
 # Common options to all Gecosistema CLI applications
@@ -117,9 +112,12 @@ def cli_run_icon2i_ingestor(**kwargs):
     main_click - main function for the CLI application
     """
     output = run_icon2i_ingestor(**kwargs)
-    
-    Logger.debug(pprint.pformat(output))
-    
+
+    # DOC: pformat walks the whole result tree — skip it entirely unless debug logging is on
+    if Logger.isEnabledFor(logging.DEBUG):
+        import pprint
+        Logger.debug(pprint.pformat(output))
+
     return output
 
 def run_icon2i_ingestor(
@@ -144,30 +142,27 @@ def run_icon2i_ingestor(
         t0, jid = prologo(backend, jid, version, verbose, debug)
 
         # DOC: -- Run the ICON-2I ingestor process -------------------------------
-        ICON2IIngestor = _ICON2IIngestor()
-        results = ICON2IIngestor.run(
-            variable=variable,
-            forecast_run=forecast_run,
-            out_dir=out_dir,
-            bucket_destination=bucket_destination,
-        )
+        # DOC: GRIB decode is CPU-heavy C-extension work that holds the GIL unevenly — a dedicated
+        # worker process keeps the caller responsive and isolates the decode/env state per invocation
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            results = executor.submit(
+                _ingestor_run_in_process,
+                variable, forecast_run, out_dir, bucket_destination,
+            ).result()
 
     except StatusException as err:
-        results = {
-            'status': err.status,
-            'body': {
-                'message': str(err),
-                ** ({"traceback": traceback.format_exc()} if debug else dict())
-            }
-        }
+        body = {'message': str(err)}
+        if debug:
+            import traceback
+            body['traceback'] = traceback.format_exc()
+        results = {'status': err.status, 'body': body}
     except Exception as e:
-        results = {
-            "status": StatusException.ERROR,
-            "body": {
-                "error": str(e),
-                ** ({"traceback": traceback.format_exc()} if debug else dict())
-            }
-        }
+        body = {"error": str(e)}
+        if debug:
+            import traceback
+            body["traceback"] = traceback.format_exc()
+        results = {"status": StatusException.ERROR, "body": body}
 
     # DOC: -- Cleanup the temporary files if needed ---------------------------
     epilogo(t0, backend, jid)
@@ -180,55 +175,50 @@ def run_icon2i_ingestor(
 
 # REGION: [ ICON2I RETRIEVER ] ========================================================================================
 
-class _ARG_NAMES_ICON2I_RETRIEVER():
-    VARIABLE = {
-        'aliases': ['--variable', '--var'],
-        'help': "Variable to retrieve, either 'precipitation' or 'water_level'.",
-        'default': None,
-        'example': '--variable precipitation',
-    }
-    LAT_RANGE = {
-        'aliases': ['--lat_range', '--lat', '--latitude_range', '--latitude', '--lt'],
-        'help': "Latitude range as two floats (min, max).",
-        'default': None,
-        'example': '--lat_range 40.0 42.0',
-    }
-    LONG_RANGE = {
-        'aliases': ['--long_range', '--long', '--longitude_range', '--longitude', '--lg'],
-        'help': "Longitude range as two floats (min, max).",
-        'default': None,
-        'example': '--long_range 12.0 14.0',
-    }
-    TIME_RANGE = {
-        'aliases': ['--time_range', '--time', '--datetime_range', '--datetime', '--t'],
-        'help': "Time range as two ISO 8601 UTC0 strings (start, end).",
-        'default': None,
-        'example': '--time_range 2025-07-23T00:00:00 2025-07-24T00:00:00',
-    }
-    OUT = {
-        'aliases': ['--out', '--output', '--o'],
-        'help': "Output file path for the retrieved data. If not provided, the output will be returned as a dictionary.",
-        'default': None,
-        'example': '--out /path/to/output.json',
-    }
-    OUT_FORMAT = {
-        'aliases': ['--out_format', '--output_format', '--of'],
-        'help': "Output format of the retrieved data.",
-        'default': None,
-        'example': '--out_format geojson',
-    }
-    BUCKET_SOURCE = {
-        'aliases': ['--bucket_source', '--bucket', '--s3'],
-        'help': "Source bucket for the input data.",
-        'default': None,
-        'example': '--bucket_source s3://my-bucket/path/to/prefix',
-    }
-    BUCKET_DESTINATION = {
-        'aliases': ['--bucket_destination', '--bucket', '--s3'],
-        'help': "Destination bucket for the output data.",
-        'default': None,
-        'example': '--bucket_destination s3://my-bucket/path/to/prefix',
-    }
+# DOC: One retriever instance per process — constructor work (cache folders, client setup) is done
+# once and amortized across repeated calls from long-lived hosts. Instantiated lazily so the heavy
+# import stack is still deferred. run() is serialized behind a lock since the instance holds shared
+# caches. (The ingestor runs in a fresh worker process per call, so it gains nothing from caching.)
+_RETRIEVER_RUN_LOCK = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _get_retriever():
+    from .icon_2i import _ICON2IRetriever
+    return _ICON2IRetriever()
+
+
+# DOC: Option tables as flat module constants — aliases expand straight into the decorators,
+# no class/dict indirection at import time
+_RETRIEVER_VARIABLE_OPT = ('--variable', '--var')
+_RETRIEVER_VARIABLE_HELP = "Variable to retrieve, either 'precipitation' or 'water_level'."
+_RETRIEVER_LAT_RANGE_OPT = ('--lat_range', '--lat', '--latitude_range', '--latitude', '--lt')
+_RETRIEVER_LAT_RANGE_HELP = "Latitude range as two floats (min, max)."
+_RETRIEVER_LONG_RANGE_OPT = ('--long_range', '--long', '--longitude_range', '--longitude', '--lg')
+_RETRIEVER_LONG_RANGE_HELP = "Longitude range as two floats (min, max)."
+_RETRIEVER_TIME_RANGE_OPT = ('--time_range', '--time', '--datetime_range', '--datetime', '--t')
+_RETRIEVER_TIME_RANGE_HELP = "Time range as two ISO 8601 UTC0 strings (start, end)."
+_RETRIEVER_OUT_OPT = ('--out', '--output', '--o')
+_RETRIEVER_OUT_HELP = "Output file path for the retrieved data. If not provided, the output will be returned as a dictionary."
+_RETRIEVER_OUT_FORMAT_OPT = ('--out_format', '--output_format', '--of')
+_RETRIEVER_OUT_FORMAT_HELP = "Output format of the retrieved data."
+_RETRIEVER_BUCKET_SOURCE_OPT = ('--bucket_source', '--bucket', '--s3')
+_RETRIEVER_BUCKET_SOURCE_HELP = "Source bucket for the input data."
+_RETRIEVER_BUCKET_DESTINATION_OPT = ('--bucket_destination', '--bucket', '--s3')
+_RETRIEVER_BUCKET_DESTINATION_HELP = "Destination bucket for the output data."
+
+
+def _parse_time_range_option(ctx, param, value):
+    """
+    Parse --time_range once at the CLI boundary — datetime.fromisoformat is far cheaper than the
+    generic parsers downstream, and passing datetime objects onward avoids re-parsing per element.
+    """
+    if not value:
+        return None
+    import datetime
+    try:
+        return [datetime.datetime.fromisoformat(s.replace('Z', '+00:00')) for s in value]
+    except ValueError:
+        raise click.BadParameter('time_range values must be valid ISO 8601 datetime strings')
 
 
 @click.command()
@@ -237,48 +227,40 @@ class _ARG_NAMES_ICON2I_RETRIEVER():
 # Specific options of your CLI application
 # -----------------------------------------------------------------------------
 @click.option(
-    *_ARG_NAMES_ICON2I_RETRIEVER.LAT_RANGE['aliases'], 
+    *_RETRIEVER_LAT_RANGE_OPT,
     callback=lambda ctx, param, value: list(value) if value else None,
-    type=float, nargs=2, default=_ARG_NAMES_ICON2I_RETRIEVER.LAT_RANGE['default'], 
-    help=_ARG_NAMES_ICON2I_RETRIEVER.LAT_RANGE['help'],
+    type=float, nargs=2, default=None, help=_RETRIEVER_LAT_RANGE_HELP,
 )
 @click.option(
-    *_ARG_NAMES_ICON2I_RETRIEVER.LONG_RANGE['aliases'],
+    *_RETRIEVER_LONG_RANGE_OPT,
     callback=lambda ctx, param, value: list(value) if value else None,
-    type=float, nargs=2, default=_ARG_NAMES_ICON2I_RETRIEVER.LONG_RANGE['default'],
-    help=_ARG_NAMES_ICON2I_RETRIEVER.LONG_RANGE['help'],
+    type=float, nargs=2, default=None, help=_RETRIEVER_LONG_RANGE_HELP,
 )
 @click.option(
-    *_ARG_NAMES_ICON2I_RETRIEVER.TIME_RANGE['aliases'],
-    callback=lambda ctx, param, value: list(value) if value else None,
-    type=str, nargs=2, default=_ARG_NAMES_ICON2I_RETRIEVER.TIME_RANGE['default'],
-    help=_ARG_NAMES_ICON2I_RETRIEVER.TIME_RANGE['help'],
+    *_RETRIEVER_TIME_RANGE_OPT,
+    callback=_parse_time_range_option,
+    type=str, nargs=2, default=None, help=_RETRIEVER_TIME_RANGE_HELP,
 )
 @click.option(
-    *_ARG_NAMES_ICON2I_RETRIEVER.VARIABLE['aliases'],
+    *_RETRIEVER_VARIABLE_OPT,
     type=click.Choice(['total_precipitation'], case_sensitive=True),
-    default=_ARG_NAMES_ICON2I_RETRIEVER.VARIABLE['default'],
-    help=_ARG_NAMES_ICON2I_RETRIEVER.VARIABLE['help'],
+    default=None, help=_RETRIEVER_VARIABLE_HELP,
 )
 @click.option(
-    *_ARG_NAMES_ICON2I_RETRIEVER.OUT['aliases'],
-    type=str, default=_ARG_NAMES_ICON2I_RETRIEVER.OUT['default'],
-    help=_ARG_NAMES_ICON2I_RETRIEVER.OUT['help'],
+    *_RETRIEVER_OUT_OPT,
+    type=str, default=None, help=_RETRIEVER_OUT_HELP,
 )
 @click.option(
-    *_ARG_NAMES_ICON2I_RETRIEVER.OUT_FORMAT['aliases'],
-    type=click.Choice(['tif'], case_sensitive=False), default=_ARG_NAMES_ICON2I_RETRIEVER.OUT_FORMAT['default'], 
-    help=_ARG_NAMES_ICON2I_RETRIEVER.OUT_FORMAT['help'],
+    *_RETRIEVER_OUT_FORMAT_OPT,
+    type=click.Choice(['tif'], case_sensitive=False), default=None, help=_RETRIEVER_OUT_FORMAT_HELP,
 )
 @click.option(
-    *_ARG_NAMES_ICON2I_RETRIEVER.BUCKET_DESTINATION['aliases'],
-    type=str, default=_ARG_NAMES_ICON2I_RETRIEVER.BUCKET_DESTINATION['default'], 
-    help=_ARG_NAMES_ICON2I_RETRIEVER.BUCKET_DESTINATION['help'],
+    *_RETRIEVER_BUCKET_DESTINATION_OPT,
+    type=str, default=None, help=_RETRIEVER_BUCKET_DESTINATION_HELP,
 )
 @click.option(
-    *_ARG_NAMES_ICON2I_RETRIEVER.BUCKET_SOURCE['aliases'],
-    type=str, default=_ARG_NAMES_ICON2I_RETRIEVER.BUCKET_SOURCE['default'],
-    help=_ARG_NAMES_ICON2I_RETRIEVER.BUCKET_SOURCE['help'],
+    *_RETRIEVER_BUCKET_SOURCE_OPT,
+    type=str, default=None, help=_RETRIEVER_BUCKET_SOURCE_HELP,
 )
 
 # -----------------------------------------------------------------------------
@@ -315,9 +297,13 @@ def cli_run_icon2i_retriever(**kwargs):
     main_click - main function for the CLI application
     """
     output = run_icon2i_retriever(**kwargs)
-    
-    Logger.debug(pprint.pformat(output))
-    
+
+    # DOC: pformat walks the whole result tree — skip it unless debug logging is on, and bound the
+    # traversal depth since retriever outputs can nest large payloads
+    if Logger.isEnabledFor(logging.DEBUG):
+        import pprint
+        Logger.debug(pprint.pformat(output, depth=3, compact=True))
+
     return output
 
 
@@ -349,34 +335,30 @@ def run_icon2i_retriever(
         t0, jid = prologo(backend, jid, version, verbose, debug)
 
         # DOC: -- Run the ARPAV retriever process -------------------------------
-        ICON2I_Retriever = _ICON2IRetriever()
-        results = ICON2I_Retriever.run(
-            lat_range=lat_range,
-            long_range=long_range,
-            time_range=time_range,
-            variable=variable,
-            out=out,
-            out_format=out_format,
-            bucket_destination=bucket_destination,
-            bucket_source=bucket_source,
-        )
+        with _RETRIEVER_RUN_LOCK:
+            results = _get_retriever().run(
+                lat_range=lat_range,
+                long_range=long_range,
+                time_range=time_range,
+                variable=variable,
+                out=out,
+                out_format=out_format,
+                bucket_destination=bucket_destination,
+                bucket_source=bucket_source,
+            )
 
     except StatusException as err:
-        results = {
-            'status': err.status,
-            'body': {
-                'message': str(err),
-                ** ({"traceback": traceback.format_exc()} if debug else dict())
-            }
-        }
+        body = {'message': str(err)}
+        if debug:
+            import traceback
+            body['traceback'] = traceback.format_exc()
+        results = {'status': err.status, 'body': body}
     except Exception as e:
-        results = {
-            "status": StatusException.ERROR,
-            "body": {
-                "error": str(e),
-                ** ({"traceback": traceback.format_exc()} if debug else dict())
-            }
-        }
+        body = {"error": str(e)}
+        if debug:
+            import traceback
+            body["traceback"] = traceback.format_exc()
+        results = {"status": StatusException.ERROR, "body": body}
 
     # DOC: -- Cleanup the temporary files if needed ---------------------------
     epilogo(t0, backend, jid)
@@ -25,12 +25,21 @@
 import os
 import random
 import shutil
+import asyncio
 import tempfile
 import fnmatch
+import importlib.util
 import boto3
+import boto3.s3.transfer
 import requests
 import logging
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+
+if importlib.util.find_spec("aioboto3") is not None:
+    import aioboto3
+else:
+    aioboto3 = None
 from requests.exceptions import RequestException
 from botocore.exceptions import ClientError, NoCredentialsError
 from .filesystem import justext, justpath, justfname, forceext
@@ -173,6 +182,15 @@ def get_client(client=None):
     return client if client else boto3.client('s3')
 
 
+# Multipart transfers saturate the link instead of a single TCP connection
+TRANSFER_CONFIG = boto3.s3.transfer.TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True,
+)
+
+
 
 def s3_upload(filename, uri, remove_src=False, client=None):
     """
@@ -189,7 +207,8 @@ def s3_upload(filename, uri, remove_src=False, client=None):
 
             client.upload_file(Filename=filename,
                                 Bucket=bucket_name, Key=key,
-                                ExtraArgs=extra_args)
+                                ExtraArgs=extra_args,
+                                Config=TRANSFER_CONFIG)
      
             if remove_src:
                 Logger.debug("removing %s", filename)
@@ -248,6 +267,82 @@ def s3_download(uri, fileout=None, remove_src=False, client=None):
     return fileout if os.path.isfile(fileout) else None
 
 
+async def _s3_transfer_many_async(mode, pairs, max_concurrency):
+    """
+    _s3_transfer_many_async - run many S3 transfers over one aioboto3 client,
+    overlapping the round-trips with a semaphore bound against throttling
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    session = aioboto3.Session()
+    async with session.client('s3') as client:
+
+        async def transfer_one(pair):
+            async with semaphore:
+                try:
+                    if mode == 'download':
+                        uri, fileout = pair
+                        bucket_name, key = get_bucket_name_key(uri)
+                        os.makedirs(justpath(fileout), exist_ok=True)
+                        await client.download_file(Bucket=bucket_name, Key=key, Filename=fileout)
+                        return fileout
+                    else:
+                        filename, uri = pair
+                        bucket_name, key = get_bucket_name_key(uri)
+                        await client.upload_file(Filename=filename, Bucket=bucket_name, Key=key)
+                        return True
+                except ClientError as ex:
+                    Logger.error(ex)
+                except NoCredentialsError as ex:
+                    Logger.error(ex)
+                return None if mode == 'download' else False
+
+        return list(await asyncio.gather(*[transfer_one(pair) for pair in pairs]))
+
+
+def s3_download_many(uri_fileout_pairs, max_concurrency=32):
+    """
+    s3_download_many - download many S3 objects at once: over aioboto3 when installed
+    (single client, latency-hiding), else over a thread pool of blocking downloads
+    """
+    uri_fileout_pairs = list(uri_fileout_pairs)
+    if len(uri_fileout_pairs) == 0:
+        return []
+    if aioboto3 is not None:
+        return asyncio.run(_s3_transfer_many_async('download', uri_fileout_pairs, max_concurrency))
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(uri_fileout_pairs))) as executor:
+        return list(executor.map(lambda pair: s3_download(pair[0], pair[1]), uri_fileout_pairs))
+
+
+def s3_upload_many(filename_uri_pairs, max_concurrency=32):
+    """
+    s3_upload_many - upload many files at once, same strategy as s3_download_many
+    """
+    filename_uri_pairs = list(filename_uri_pairs)
+    if len(filename_uri_pairs) == 0:
+        return []
+    if aioboto3 is not None:
+        return asyncio.run(_s3_transfer_many_async('upload', filename_uri_pairs, max_concurrency))
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(filename_uri_pairs))) as executor:
+        return list(executor.map(lambda pair: s3_upload(pair[0], pair[1]), filename_uri_pairs))
+
+
+def s3_head(uri, client=None):
+    """
+    s3_head - return the head_object metadata of an S3 object, or None if it does not exist
+    """
+    try:
+        bucket_name, filepath = get_bucket_name_key(uri)
+        if bucket_name and filepath:
+            client = get_client(client)
+            return client.head_object(Bucket=bucket_name, Key=filepath)
+    except ClientError as ex:
+        # a missing key is an expected outcome for existence probes
+        Logger.debug(ex)
+    except NoCredentialsError as ex:
+        Logger.error(ex)
+    return None
+
+
 def s3_exists(uri, client=None):
     """
     s3_exists
@@ -27,6 +27,21 @@ import requests
 import datetime
 from ..cli.module_log import Logger
 
+# DOC: orjson encodes/decodes in C (and serializes numpy scalars natively) — use it when
+# installed, fall back to stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(data):
+    return orjson.dumps(data) if orjson is not None else json.dumps(data)
+
+
+def _json_loads(text):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
 
 def patch(url, data):
     """
@@ -38,8 +53,8 @@ def patch(url, data):
     try:
         headers = {"content-type": "application/json"}
         # url = url if url.startswith("http") else f"http://{backend}:8000{url}"
-        response = requests.patch(url, data=json.dumps(data), headers=headers, timeout=3)
-        return json.loads(response.text)
+        response = requests.patch(url, data=_json_dumps(data), headers=headers, timeout=3)
+        return _json_loads(response.text)
     except Exception as ex:
         Logger.error("Error in patch:%s", ex)
         return {}
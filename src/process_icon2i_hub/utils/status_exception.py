@@ -10,4 +10,8 @@ class StatusException(Exception):
     def __init__(self, status, message):
         self.status = status
         self.message = message
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+    def __reduce__(self):
+        # the two-argument signature breaks default Exception pickling (e.g. across process pools)
+        return (StatusException, (self.status, self.message))
\ No newline at end of file